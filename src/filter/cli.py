@@ -1,39 +1,57 @@
 """Command line interface for Filter."""
 
 import argparse
-import json
+import functools
 import logging
 import os
 import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from dotenv import load_dotenv
-import yaml
-
-from .workspace import (
-    create_workspace, 
-    list_templates, 
-    render_template, 
-    exec_workspace_command,
-    stop_workspace,
-    delete_workspace,
-    create_story_workspace
-)
-from .projects import (
-    create_project,
-    list_projects,
-    delete_project,
-    find_story_in_projects,
-    get_project_path
-)
-from .config import get_workspaces_directory
 
+from . import __version__
+from .config import get_cache_directory, get_projects_directory, load_yaml
 
+# Characters GitHub allows in repository names
+_GITHUB_NAME_RE = re.compile(r'^[a-zA-Z0-9\-_.]+$')
+
+# Story templates bundled with the repository
+_STORY_TEMPLATE_DIR = Path(__file__).parent.parent.parent / "story" / "templates"
+
+# Cache lookup sentinel, since parsed YAML may legitimately be None
+_MISSING = object()
+
+# Process environment variables exposed to templates alongside a .env file
+ENV_WHITELIST = frozenset({
+    'HOME', 'USER', 'LOGNAME', 'PWD', 'SHELL', 'HOSTNAME', 'LANG', 'TZ',
+})
+
+# Bare "{{ name }}" placeholder; anything else in a template needs Jinja2
+_PLACEHOLDER_RE = re.compile(r'\{\{\s*(\w+)\s*\}\}')
+
+
+def cli_error_handler(func):
+    """Report a command handler's expected failures and exit with status 1."""
+    @functools.wraps(func)
+    def wrapper(args):
+        try:
+            return func(args)
+        except (RuntimeError, FileExistsError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    return wrapper
+
+
+def _opt_path(value):
+    """Convert an optional path argument to a Path, keeping None/empty as None."""
+    return Path(value) if value else None
+
+
+@cli_error_handler
 def workspace_create_command(args):
     """Handle workspace create subcommand."""
-    logging.basicConfig(level=logging.INFO)
+    from .workspace import create_workspace, list_templates
     
     if args.list_templates:
         templates = list_templates()
@@ -50,238 +68,349 @@ def workspace_create_command(args):
         print("Error: workspace name is required", file=sys.stderr)
         sys.exit(1)
     
-    try:
-        base_dir = None
-        if hasattr(args, 'base_dir') and args.base_dir:
-            base_dir = Path(args.base_dir)
-        workspace_path = create_workspace(
-            args.name, 
-            base_dir, 
-            args.template
-        )
-        print(f"Workspace '{args.name}' created at: {workspace_path}")
-        print(f"To start: cd {workspace_path} && docker compose up")
-    except FileExistsError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    base_dir = _opt_path(args.base_dir)
+    workspace_path = create_workspace(
+        args.name, 
+        base_dir, 
+        args.template
+    )
+    print(f"Workspace '{args.name}' created at: {workspace_path}")
+    print(f"To start: cd {workspace_path} && docker compose up")
 
 
+@cli_error_handler
 def workspace_down_command(args):
     """Handle workspace down subcommand."""
-    logging.basicConfig(level=logging.INFO)
+    from .workspace import stop_workspace
     
-    try:
-        base_dir = None
-        if hasattr(args, 'base_dir') and args.base_dir:
-            base_dir = Path(args.base_dir)
-        stop_workspace(args.name, base_dir)
-        print(f"Workspace '{args.name}' stopped successfully")
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    base_dir = _opt_path(args.base_dir)
+    stop_workspace(args.name, base_dir)
+    print(f"Workspace '{args.name}' stopped successfully")
 
 
+@cli_error_handler
 def workspace_delete_command(args):
     """Handle workspace delete subcommand."""
-    logging.basicConfig(level=logging.INFO)
+    from .workspace import delete_workspace
+    
+    base_dir = _opt_path(args.base_dir)
+    delete_workspace(args.name, base_dir, args.force)
+    print(f"Workspace '{args.name}' deleted successfully")
+
+
+class _YAMLSyntaxError(ValueError):
+    """A YAML file failed to parse; lets callers avoid importing yaml."""
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_cache():
+    """Open the on-disk cache of parsed template config files.
     
+    The cache is opt-in through FILTER_CONFIG_CACHE=1, since for typical
+    small configs importing diskcache and opening SQLite costs more than
+    parsing. The cache directory is kept private to the user (mode 0700).
+    Returns None when the cache is not enabled, the optional diskcache
+    package is not installed, or the cache cannot be opened (unwritable
+    directory, corrupt or locked database).
+    """
+    if os.environ.get('FILTER_CONFIG_CACHE') != '1':
+        return None
     try:
-        base_dir = None
-        if hasattr(args, 'base_dir') and args.base_dir:
-            base_dir = Path(args.base_dir)
-        delete_workspace(args.name, base_dir, args.force)
-        print(f"Workspace '{args.name}' deleted successfully")
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+        from diskcache import Cache
+    except ImportError:
+        return None
+    cache_dir = get_cache_directory() / "parsed"
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Also tighten a directory created by an earlier, laxer version
+        os.chmod(cache_dir, 0o700)
+        return Cache(os.fspath(cache_dir))
+    except Exception as e:
+        logging.debug(f"Parsed-file cache disabled: {e}")
+        return None
 
 
-def story_create_command(args):
-    """Handle story creation using template."""
-    import re
+def _file_signature(path: str) -> tuple:
+    """Identify a file's current contents by absolute path, mtime and size."""
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _cached_parse(kind: str, signature: tuple, parse):
+    """Parse a file, memoized on disk across processes when possible.
+    
+    The disk cache is best-effort: if reading or writing it fails for any
+    reason, the file is parsed directly. Errors from parse itself propagate.
+    
+    Args:
+        kind: Parser name, keeps different parsers of one file apart
+        signature: Result of _file_signature for the file to parse
+        parse: Callable taking the path and returning the parsed data
+        
+    Returns:
+        Parsed data
+    """
+    cache = _parse_cache()
+    if cache is None:
+        return parse(signature[0])
+    
+    key = (kind,) + signature
+    try:
+        data = cache.get(key, default=_MISSING)
+    except Exception as e:
+        logging.debug(f"Parsed-file cache read failed: {e}")
+        return parse(signature[0])
+    
+    if data is _MISSING:
+        data = parse(signature[0])
+        try:
+            cache.set(key, data)
+        except Exception as e:
+            logging.debug(f"Parsed-file cache write failed: {e}")
+    return data
+
+
+def _parse_yaml_file(path: str):
+    """Parse a YAML file.
+    
+    Raises:
+        _YAMLSyntaxError: If the file is not valid YAML
+    """
     import yaml
+    
+    try:
+        return load_yaml(Path(path).read_bytes())
+    except yaml.YAMLError as e:
+        raise _YAMLSyntaxError(str(e)) from e
+
+
+def _parse_env_file(path: str) -> dict:
+    """Parse a .env file into a dict, skipping keys without a value."""
+    from dotenv import dotenv_values
+    
+    return {
+        key: value for key, value in dotenv_values(path).items()
+        if value is not None
+    }
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_file(signature: tuple):
+    """Parse a YAML file, cached on its _file_signature.
+    
+    An edited file gets a new signature and is parsed again. The returned
+    data is shared between calls and must not be modified.
+    """
+    return _cached_parse('yaml', signature, _parse_yaml_file)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_env_file(signature: tuple) -> dict:
+    """Parse a .env file, cached in memory on its _file_signature.
+    
+    Unlike YAML configs, .env contents are never written to the on-disk
+    cache: they commonly hold credentials, which must not outlive the file.
+    """
+    return _parse_env_file(signature[0])
+
+
+@functools.lru_cache(maxsize=1)
+def _story_env():
+    """Get the Jinja2 environment for story templates, built once per process."""
     from jinja2 import Environment, FileSystemLoader
-    from .config import get_projects_directory
+
+    return Environment(loader=FileSystemLoader(_STORY_TEMPLATE_DIR), auto_reload=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _plain_story_template(name: str):
+    """Load a story template that only substitutes variables.
     
-    logging.basicConfig(level=logging.INFO)
+    Returns None when the template uses any other Jinja2 syntax, in which
+    case it must be rendered through the full Jinja2 environment.
+    """
+    # FileSystemLoader, used for the Jinja2 path, always decodes UTF-8
+    source = (_STORY_TEMPLATE_DIR / name).read_text(encoding="utf-8")
+    if '{%' in source or '{#' in source or '{{' in _PLACEHOLDER_RE.sub('', source):
+        return None
+    # Jinja2 drops a single trailing newline by default
+    return source[:-1] if source.endswith('\n') else source
+
+
+def render_story_template(name: str, **context) -> str:
+    """Render a story template, skipping Jinja2 for plain substitution.
     
-    try:
-        # Find project for this story prefix or ask user to specify
-        if hasattr(args, 'project') and args.project:
-            project_name = args.project
-            projects_dir = get_projects_directory()
-            project_dir = projects_dir / project_name
-            if not project_dir.exists():
-                raise RuntimeError(f"Project '{project_name}' not found")
-        else:
-            # TODO: Could auto-detect from story_id prefix in the future
-            print("Error: --project is required for story creation", file=sys.stderr)
-            sys.exit(1)
-        
-        # Read project config
-        config_file = project_dir / "project.yaml"
-        if not config_file.exists():
-            raise RuntimeError(f"Project config not found: {config_file}")
-            
-        with open(config_file) as f:
-            project_config = yaml.safe_load(f)
-        
-        # Generate story ID if not provided
-        if hasattr(args, 'story_id') and args.story_id:
-            story_id = args.story_id
-        else:
-            # Auto-generate next story ID
-            story_id = generate_next_story_id(project_dir, project_config.get('prefix', project_name[:5]))
-        
-        # Get required information
-        story_description = args.description
-        repository = project_config.get('git_url', '')
-        branch_from = getattr(args, 'branch_from', 'main')
-        merge_to = getattr(args, 'merge_to', 'main')
-        feature_branch = f"{story_id}-{args.feature_suffix}" if hasattr(args, 'feature_suffix') and args.feature_suffix else story_id
-        
-        # Load and render template
-        template_dir = Path(__file__).parent.parent.parent / "story" / "templates"
-        env = Environment(loader=FileSystemLoader(template_dir))
-        template = env.get_template("default.md.j2")
-        
-        rendered = template.render(
-            story_id=story_id,
-            story_description=story_description,
-            repository=repository,
-            branch_from=branch_from,
-            merge_to=merge_to,
-            feature_branch=feature_branch
-        )
-        
-        # Write story file
-        story_file = project_dir / "kanban" / "stories" / f"{story_id}.md"
-        story_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(story_file, 'w') as f:
-            f.write(rendered)
-        
-        print(f"Story '{story_id}' created at: {story_file}")
-        print(f"To create workspace: filter story workspace {story_id}")
+    Args:
+        name: Template file name within the story templates directory
+        **context: Template variables
         
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
+    Returns:
+        Rendered template content
+    """
+    source = _plain_story_template(name)
+    if source is None:
+        return _story_env().get_template(name).render(**context)
+    return _PLACEHOLDER_RE.sub(lambda m: str(context.get(m.group(1), '')), source)
+
+
+@cli_error_handler
+def story_create_command(args):
+    """Handle story creation using template."""
+    # Find project for this story prefix or ask user to specify
+    if args.project:
+        project_name = args.project
+        projects_dir = get_projects_directory()
+        project_dir = projects_dir / project_name
+        if not project_dir.exists():
+            raise RuntimeError(f"Project '{project_name}' not found")
+    else:
+        # TODO: Could auto-detect from story_id prefix in the future
+        print("Error: --project is required for story creation", file=sys.stderr)
         sys.exit(1)
+    
+    # Read project config
+    config_file = project_dir / "project.yaml"
+    try:
+        project_config = load_yaml(config_file.read_bytes()) or {}
+    except FileNotFoundError:
+        raise RuntimeError(f"Project config not found: {config_file}")
+    
+    # Generate story ID if not provided
+    if args.story_id:
+        story_id = args.story_id
+    else:
+        # Auto-generate next story ID
+        prefix = project_config.get('prefix') or project_name[:5]
+        story_id = generate_next_story_id(project_dir, prefix)
+    
+    # Get required information
+    story_description = args.description
+    repository = project_config.get('git_url', '')
+    branch_from = args.branch_from
+    merge_to = args.merge_to
+    feature_branch = f"{story_id}-{args.feature_suffix}" if args.feature_suffix else story_id
+    
+    # Load and render template
+    rendered = render_story_template(
+        "default.md.j2",
+        story_id=story_id,
+        story_description=story_description,
+        repository=repository,
+        branch_from=branch_from,
+        merge_to=merge_to,
+        feature_branch=feature_branch
+    )
+    
+    # Write story file
+    story_file = project_dir / "kanban" / "stories" / f"{story_id}.md"
+    story_file.parent.mkdir(parents=True, exist_ok=True)
+    # Under a non-UTF-8 locale, command line arguments carry undecodable
+    # bytes as surrogates; surrogateescape writes those bytes back unchanged
+    story_file.write_text(rendered, encoding="utf-8", errors="surrogateescape")
+    
+    print(f"Story '{story_id}' created at: {story_file}")
+    print(f"To create workspace: filter story workspace {story_id}")
 
 
 def generate_next_story_id(project_dir: Path, prefix: str) -> str:
     """Generate the next story ID by looking at existing stories."""
-    import re
-    
     stories_dir = project_dir / "kanban" / "stories"
-    if not stories_dir.exists():
-        return f"{prefix}-1"
     
     max_id = 0
-    pattern = re.compile(rf"^{re.escape(prefix)}-(\d+)\.md$")
+    story_prefix = f"{prefix}-"
     
-    for story_file in stories_dir.glob("*.md"):
-        match = pattern.match(story_file.name)
-        if match:
-            story_num = int(match.group(1))
-            max_id = max(max_id, story_num)
+    # Match "<prefix>-<number>.md" with plain string checks on the raw
+    # directory entries rather than building a Path per file for a regex
+    try:
+        with os.scandir(stories_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(story_prefix) and name.endswith(".md")):
+                    continue
+                story_num = name[len(story_prefix):-3]
+                if story_num.isdecimal():
+                    max_id = max(max_id, int(story_num))
+    except FileNotFoundError:
+        pass
     
     return f"{prefix}-{max_id + 1}"
 
 
+@cli_error_handler
 def story_delete_command(args):
     """Handle story deletion."""
-    logging.basicConfig(level=logging.INFO)
+    from .projects import find_story_in_projects
     
-    try:
-        # Find the story
-        story_info = find_story_in_projects(args.story_id)
-        if not story_info:
-            raise RuntimeError(f"Story '{args.story_id}' not found in any project")
-        
-        story_file = story_info['story_file']
-        project_name = story_info['project_name']
-        
-        # Confirm deletion unless forced
-        if not args.force:
-            response = input(f"Delete story '{args.story_id}' from project '{project_name}'? (y/N): ")
-            if response.lower() != 'y':
-                print("Deletion cancelled")
-                return
-        
-        # Delete the story file
-        story_file.unlink()
-        print(f"Story '{args.story_id}' deleted from project '{project_name}'")
-        
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    # Find the story
+    story_info = find_story_in_projects(args.story_id)
+    if not story_info:
+        raise RuntimeError(f"Story '{args.story_id}' not found in any project")
+    
+    story_file = story_info['story_file']
+    project_name = story_info['project_name']
+    
+    # Confirm deletion unless forced
+    if not args.force:
+        response = input(f"Delete story '{args.story_id}' from project '{project_name}'? (y/N): ")
+        if response.lower() != 'y':
+            print("Deletion cancelled")
+            return
+    
+    # Delete the story file
+    story_file.unlink()
+    print(f"Story '{args.story_id}' deleted from project '{project_name}'")
 
 
+@cli_error_handler
 def story_workspace_command(args):
     """Handle story workspace creation."""
-    logging.basicConfig(level=logging.INFO)
+    from .workspace import create_story_workspace
     
-    try:
-        base_dir = None
-        if hasattr(args, 'base_dir') and args.base_dir:
-            base_dir = Path(args.base_dir)
-            
-        workspace_path = create_story_workspace(
-            args.story_name,
-            base_dir,
-            args.template
-        )
-        print(f"Story workspace '{args.story_name}' created at: {workspace_path}")
-        print(f"To start: cd {workspace_path} && docker compose up")
+    base_dir = _opt_path(args.base_dir)
         
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    workspace_path = create_story_workspace(
+        args.story_name,
+        base_dir,
+        args.template
+    )
+    print(f"Story workspace '{args.story_name}' created at: {workspace_path}")
+    print(f"To start: cd {workspace_path} && docker compose up")
+
+
+_STORY_ACTIONS = {
+    'create': story_create_command,
+    'delete': story_delete_command,
+    'workspace': story_workspace_command,
+}
 
 
 def story_command(args):
     """Handle story command routing."""
-    # For backwards compatibility - if no subcommand specified, show help
-    if not hasattr(args, 'story_func'):
+    action = _STORY_ACTIONS.get(args.story_command)
+    if action is None:
         print("Error: story command requires a subcommand (create, delete, workspace)", file=sys.stderr)
         print("Use 'filter story --help' for more information")
         sys.exit(1)
     
-    args.story_func(args)
+    action(args)
 
 
-def workspace_command(args):
-    """Handle workspace command routing."""
-    # For backwards compatibility - if no subcommand specified, default to create
-    if not hasattr(args, 'workspace_action') or args.workspace_action is None:
-        # Check if this looks like old-style usage
-        if hasattr(args, 'name') and args.name:
-            workspace_create_command(args)
-        else:
-            print("Error: Please specify a workspace action: create, down, or delete", file=sys.stderr)
-            print("Usage: workspace create <name>", file=sys.stderr)
-            sys.exit(1)
-    else:
-        # Subcommand specified, call the appropriate function
-        args.func(args)
+_WORKSPACE_ACTIONS = {
+    'create': workspace_create_command,
+    'down': workspace_down_command,
+    'delete': workspace_delete_command,
+}
 
 
-def safe_getattr(obj, attr: str, default: str = '') -> str:
-    """Safely get attribute value with fallback to default.
+def workspace_command(args):
+    """Handle workspace command routing."""
+    action = _WORKSPACE_ACTIONS.get(args.workspace_action)
+    if action is None:
+        print("Error: Please specify a workspace action: create, down, or delete", file=sys.stderr)
+        print("Usage: workspace create <name>", file=sys.stderr)
+        sys.exit(1)
     
-    Args:
-        obj: Object to get attribute from
-        attr: Attribute name
-        default: Default value if attribute is None or empty
-        
-    Returns:
-        Attribute value or default
-    """
-    return getattr(obj, attr, default) or default
+    action(args)
 
 
 def validate_github_repo_name(name: str) -> bool:
@@ -296,7 +425,47 @@ def validate_github_repo_name(name: str) -> bool:
     if not name or len(name) > 100:
         return False
     # Allow alphanumeric, hyphens, underscores, and dots
-    return re.match(r'^[a-zA-Z0-9\-_.]+$', name) is not None
+    return _GITHUB_NAME_RE.match(name) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def check_command_available(command: str) -> bool:
+    """Check whether an external command is installed.
+    
+    The PATH is searched in-process, without spawning the command, and
+    the result is cached for the lifetime of the process.
+    
+    Args:
+        command: Executable name (e.g., 'gh', 'git')
+        
+    Returns:
+        True if an executable named `command` is on the PATH, False otherwise
+    """
+    return shutil.which(command) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def get_current_github_user() -> str:
+    """Get the login of the user authenticated with the gh CLI.
+    
+    Cached for the lifetime of the process to avoid repeated API calls.
+    
+    Returns:
+        GitHub username
+        
+    Raises:
+        RuntimeError: If the user cannot be determined
+    """
+    try:
+        # Let gh extract the login field instead of decoding the whole user object
+        result = subprocess.run(['gh', 'api', 'user', '--jq', '.login'], capture_output=True, text=True, check=True)
+    except subprocess.CalledProcessError:
+        raise RuntimeError("Failed to get GitHub user information. Make sure you're authenticated with 'gh auth login'")
+    
+    github_user = result.stdout.strip()
+    if not github_user:
+        raise RuntimeError("Could not determine GitHub username")
+    return github_user
 
 
 def create_github_repository(project_name: str, github_user: str = None, description: str = "", is_private: bool = False) -> str:
@@ -319,21 +488,12 @@ def create_github_repository(project_name: str, github_user: str = None, descrip
         raise RuntimeError(f"Invalid repository name: '{project_name}'. Must contain only alphanumeric characters, hyphens, underscores, and dots, and be 100 characters or less.")
     
     # Check if gh CLI is available
-    try:
-        subprocess.run(['gh', '--version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not check_command_available('gh'):
         raise RuntimeError("GitHub CLI (gh) is not installed or not in PATH. Install it from https://cli.github.com/")
     
     # Get current GitHub user if not specified
     if not github_user:
-        try:
-            result = subprocess.run(['gh', 'api', 'user'], capture_output=True, text=True, check=True)
-            user_data = json.loads(result.stdout)
-            github_user = user_data.get('login')
-            if not github_user:
-                raise RuntimeError("Could not determine GitHub username")
-        except (subprocess.CalledProcessError, json.JSONDecodeError):
-            raise RuntimeError("Failed to get GitHub user information. Make sure you're authenticated with 'gh auth login'")
+        github_user = get_current_github_user()
     
     # Construct repository name
     repo_name = f"{github_user}/{project_name}"
@@ -358,182 +518,194 @@ def create_github_repository(project_name: str, github_user: str = None, descrip
         raise RuntimeError(f"Failed to create GitHub repository: {e.stderr.strip()}")
 
 
+@cli_error_handler
 def project_create_command(args):
     """Handle project create subcommand."""
-    logging.basicConfig(level=logging.INFO)
+    from .projects import create_project, generate_project_prefix
     
-    try:
-        base_dir = None
-        if hasattr(args, 'base_dir') and args.base_dir:
-            base_dir = Path(args.base_dir)
-        
-        # Handle GitHub repository creation if requested
-        git_url = safe_getattr(args, 'git_url')
-        
-        if getattr(args, 'create_repo', False):
-            if git_url:
-                print("Warning: --create-repo specified but --git-url already provided. Using existing git-url.")
-            else:
-                description = safe_getattr(args, 'description')
-                github_user = getattr(args, 'github_user', None)
-                is_private = getattr(args, 'private', False)
-                
-                print(f"Creating GitHub repository for project '{args.name}'...")
-                git_url = create_github_repository(
-                    args.name, 
-                    github_user=github_user,
-                    description=description,
-                    is_private=is_private
-                )
-                print(f"GitHub repository created: {git_url}")
-        
-        project_path = create_project(
-            args.name,
-            base_dir,
-            copy_kanban=not args.no_kanban,
-            description=safe_getattr(args, 'description'),
-            git_url=git_url,
-            maintainers=getattr(args, 'maintainers', None) or []
-        )
-        print(f"Project '{args.name}' created at: {project_path}")
-        
-        # Load and display the generated config
-        from .projects import load_project_config, generate_project_prefix
-        config = load_project_config(project_path)
-        if config:
-            prefix = config.get('prefix', generate_project_prefix(args.name))
-            print(f"Story prefix: {prefix} (use for stories like {prefix}-1, {prefix}-2-refactor)")
-        
-        if not args.no_kanban:
-            print(f"Kanban structure available at: {project_path / 'kanban'}")
-        
-        print(f"Project config: {project_path / 'project.yaml'}")
-        
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    base_dir = _opt_path(args.base_dir)
+    
+    # Handle GitHub repository creation if requested
+    git_url = args.git_url or ''
+    
+    if args.create_repo:
+        if git_url:
+            print("Warning: --create-repo specified but --git-url already provided. Using existing git-url.")
+        else:
+            description = args.description or ''
+            github_user = args.github_user
+            is_private = args.private
+            
+            print(f"Creating GitHub repository for project '{args.name}'...")
+            git_url = create_github_repository(
+                args.name, 
+                github_user=github_user,
+                description=description,
+                is_private=is_private
+            )
+            print(f"GitHub repository created: {git_url}")
+    
+    project_path = create_project(
+        args.name,
+        base_dir,
+        copy_kanban=not args.no_kanban,
+        description=args.description or '',
+        git_url=git_url,
+        maintainers=args.maintainers or []
+    )
+    print(f"Project '{args.name}' created at: {project_path}")
+    
+    # Display the story prefix written to project.yaml, without re-reading it
+    prefix = generate_project_prefix(args.name)
+    print(f"Story prefix: {prefix} (use for stories like {prefix}-1, {prefix}-2-refactor)")
+    
+    if not args.no_kanban:
+        print(f"Kanban structure available at: {project_path / 'kanban'}")
+    
+    print(f"Project config: {project_path / 'project.yaml'}")
 
 
+@cli_error_handler
 def project_list_command(args):
     """Handle project list subcommand."""
-    try:
-        base_dir = None
-        if hasattr(args, 'base_dir') and args.base_dir:
-            base_dir = Path(args.base_dir)
-            
-        projects = list_projects(base_dir)
-        if projects:
-            print("Available projects:")
-            for project in projects:
-                print(f"  {project}")
-        else:
-            print("No projects found.")
-            
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    from .projects import list_projects
+    
+    base_dir = _opt_path(args.base_dir)
+        
+    projects = list_projects(base_dir)
+    if projects:
+        print("Available projects:")
+        for project in projects:
+            print(f"  {project}")
+    else:
+        print("No projects found.")
 
 
+@cli_error_handler
 def project_delete_command(args):
     """Handle project delete subcommand."""
-    logging.basicConfig(level=logging.INFO)
+    from .projects import delete_project
     
-    try:
-        base_dir = None
-        if hasattr(args, 'base_dir') and args.base_dir:
-            base_dir = Path(args.base_dir)
-            
-        delete_project(args.name, base_dir, args.force)
-        print(f"Project '{args.name}' deleted successfully")
+    base_dir = _opt_path(args.base_dir)
         
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    delete_project(args.name, base_dir, args.force)
+    print(f"Project '{args.name}' deleted successfully")
+
+
+_PROJECT_ACTIONS = {
+    'create': project_create_command,
+    'list': project_list_command,
+    'delete': project_delete_command,
+}
 
 
 def project_command(args):
     """Handle project command routing."""
-    if not hasattr(args, 'project_action') or args.project_action is None:
+    action = _PROJECT_ACTIONS.get(args.project_action)
+    if action is None:
         print("Error: Please specify a project action: create, list, or delete", file=sys.stderr)
         print("Usage: project create <name>", file=sys.stderr)
         sys.exit(1)
-    else:
-        # Subcommand specified, call the appropriate function
-        args.func(args)
+    
+    action(args)
 
 
+@cli_error_handler
 def claude_command(args):
     """Handle claude session command."""
-    try:
-        command = ["claude"]
-        if hasattr(args, 'resume') and args.resume:
-            command.append("-r")
-        command.append("--dangerously-skip-permissions")
-        
-        exit_code = exec_workspace_command(args.workspace, command)
-        sys.exit(exit_code)
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    from .workspace import exec_workspace_command_replace
+    
+    command = ["claude"]
+    if args.resume:
+        command.append("-r")
+    command.append("--dangerously-skip-permissions")
+    
+    exec_workspace_command_replace(args.workspace, command)
 
 
+@cli_error_handler
 def bash_command(args):
     """Handle bash shell command."""
-    try:
-        command = ["bash"]
-        if hasattr(args, 'command_args') and args.command_args:
-            command.extend(args.command_args)
-        exit_code = exec_workspace_command(args.workspace, command)
-        sys.exit(exit_code)
-    except RuntimeError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    from .workspace import exec_workspace_command_replace
+    
+    command = ["bash"]
+    if args.command_args:
+        command.extend(args.command_args)
+    exec_workspace_command_replace(args.workspace, command)
 
 
 def template_command(args):
     """Handle template rendering command."""
-    # Load template variables from multiple sources
-    context = {}
+    from .workspace import render_template
 
-    # 1. Load from YAML config file (lowest priority)
-    if Path(args.config).exists():
-        try:
-            with open(args.config, 'r') as f:
-                config_data = yaml.safe_load(f)
-                if config_data:
-                    context.update(config_data)
-        except yaml.YAMLError as e:
-            print(f"Error parsing YAML config file {args.config}: {e}",
-                  file=sys.stderr)
-            sys.exit(1)
-        except Exception as e:
-            print(f"Error reading config file {args.config}: {e}",
+    # Load template variables from multiple sources, merged once at the end
+
+    # 1. Load from YAML config file (lowest priority); a missing file is
+    # detected by the stat that signs it rather than a separate exists()
+    config_file = args.config or "config.yaml"
+    try:
+        config_data = _load_yaml_file(_file_signature(config_file))
+        if config_data is None:
+            config_data = {}
+        elif not isinstance(config_data, dict):
+            raise ValueError(
+                "top level must be a mapping of variables, "
+                f"not {type(config_data).__name__}"
+            )
+    except FileNotFoundError:
+        if args.config:
+            # If specific config file was requested but doesn't exist, error
+            print(f"Error: config file not found: {args.config}",
                   file=sys.stderr)
             sys.exit(1)
+        config_data = {}
+    except _YAMLSyntaxError as e:
+        print(f"Error parsing YAML config file {config_file}: {e}",
+              file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error reading config file {config_file}: {e}",
+              file=sys.stderr)
+        sys.exit(1)
 
     # 2. Load from .env file (medium priority - overrides config)
     env_file = args.env_file or ".env"
-    if Path(env_file).exists():
-        load_dotenv(env_file)
-        # Add all environment variables to context
-        context.update(os.environ)
-    elif args.env_file:
-        # If specific .env file was requested but doesn't exist, error
-        print(f"Error: .env file not found: {args.env_file}",
-              file=sys.stderr)
-        sys.exit(1)
+    try:
+        env_data = _load_env_file(_file_signature(env_file))
+    except FileNotFoundError:
+        if args.env_file:
+            # If specific .env file was requested but doesn't exist, error
+            print(f"Error: .env file not found: {args.env_file}",
+                  file=sys.stderr)
+            sys.exit(1)
+        env_data = None
+    shell_env = {}
+    if env_data is not None:
+        # Shell variables templates commonly use go in under the file's own
+        # values; the rest of the process environment is left out
+        shell_env = {
+            key: os.environ[key] for key in ENV_WHITELIST if key in os.environ
+        }
 
     # 3. Parse command line template variables (highest priority)
-    for var in args.var:
-        if "=" not in var:
-            print(f"Error: Invalid variable format '{var}'. "
-                  "Use key=value format.", file=sys.stderr)
-            sys.exit(1)
-        key, value = var.split("=", 1)
-        context[key] = value
+    parsed_vars = [var.partition("=") for var in args.var]
+    invalid = [var for var, (_, sep, _) in zip(args.var, parsed_vars) if not sep]
+    if invalid:
+        formatted = ", ".join(f"'{var}'" for var in invalid)
+        print(f"Error: Invalid variable format {formatted}. "
+              "Use key=value format.", file=sys.stderr)
+        sys.exit(1)
+
+    context = {
+        **config_data,
+        **shell_env,
+        **(env_data or {}),
+        **{key: value for key, _, value in parsed_vars},
+    }
 
     try:
-        # Render template and output to stdout
+        # Render the whole template before writing, so a render error
+        # leaves no partial output behind
         result = render_template(args.template, context)
         print(result, end="")
     except FileNotFoundError as e:
@@ -544,14 +716,8 @@ def template_command(args):
         sys.exit(1)
 
 
-def main():
-    """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description="Filter - LLM-Powered Kanban board CLI"
-    )
-    subparsers = parser.add_subparsers(dest='command', help='Commands')
-
-    # Workspace command with subcommands
+def _add_workspace_parser(subparsers):
+    """Add the workspace command and its create/down/delete actions."""
     workspace_parser = subparsers.add_parser(
         'workspace', help='Manage Docker workspaces'
     )
@@ -578,7 +744,6 @@ def main():
         '--list-templates', action='store_true',
         help='List available templates'
     )
-    create_parser.set_defaults(func=workspace_create_command)
     
     # Down subcommand
     down_parser = workspace_subparsers.add_parser(
@@ -591,7 +756,6 @@ def main():
         '--base-dir',
         help='Base directory for workspaces (default: from config)'
     )
-    down_parser.set_defaults(func=workspace_down_command)
     
     # Delete subcommand
     delete_parser = workspace_subparsers.add_parser(
@@ -608,12 +772,13 @@ def main():
         '--force', '-f', action='store_true',
         help='Force delete running workspace (stops it first)'
     )
-    delete_parser.set_defaults(func=workspace_delete_command)
     
     # Set default routing function for workspace command
     workspace_parser.set_defaults(func=workspace_command)
 
-    # Project command with subcommands
+
+def _add_project_parser(subparsers):
+    """Add the project command and its create/list/delete actions."""
     project_parser = subparsers.add_parser('project', help='Manage projects')
     project_subparsers = project_parser.add_subparsers(dest='project_action', help='Project actions')
     
@@ -660,7 +825,6 @@ def main():
         '--private', action='store_true',
         help='Create private repository'
     )
-    project_create_parser.set_defaults(func=project_create_command)
     
     # List subcommand
     project_list_parser = project_subparsers.add_parser(
@@ -670,7 +834,6 @@ def main():
         '--base-dir',
         help='Base directory for projects (default: from config)'
     )
-    project_list_parser.set_defaults(func=project_list_command)
     
     # Delete subcommand
     project_delete_parser = project_subparsers.add_parser(
@@ -687,12 +850,13 @@ def main():
         '--force', '-f', action='store_true',
         help='Force delete without confirmation'
     )
-    project_delete_parser.set_defaults(func=project_delete_command)
     
     # Set default routing function for project command
     project_parser.set_defaults(func=project_command)
 
-    # Story management command
+
+def _add_story_parser(subparsers):
+    """Add the story command and its create/delete/workspace actions."""
     story_parser = subparsers.add_parser(
         'story', help='Manage stories (create, delete, workspace)'
     )
@@ -727,7 +891,6 @@ def main():
         '--feature-suffix',
         help='Feature branch suffix (default: story-id only)'
     )
-    story_create_parser.set_defaults(story_func=story_create_command)
     
     # Story delete subcommand
     story_delete_parser = story_subparsers.add_parser(
@@ -740,7 +903,6 @@ def main():
         '--force', '-f', action='store_true',
         help='Force delete without confirmation'
     )
-    story_delete_parser.set_defaults(story_func=story_delete_command)
     
     # Story workspace subcommand
     story_workspace_parser = story_subparsers.add_parser(
@@ -757,12 +919,13 @@ def main():
         '--base-dir',
         help='Base directory for workspaces (default: from config)'
     )
-    story_workspace_parser.set_defaults(story_func=story_workspace_command)
     
     # Set default routing function for story command
     story_parser.set_defaults(func=story_command)
 
-    # Claude command
+
+def _add_claude_parser(subparsers):
+    """Add the claude session command."""
     claude_parser = subparsers.add_parser(
         'claude', help='Start Claude session in workspace'
     )
@@ -775,7 +938,9 @@ def main():
     )
     claude_parser.set_defaults(func=claude_command)
 
-    # Bash command
+
+def _add_bash_parser(subparsers):
+    """Add the bash shell command."""
     bash_parser = subparsers.add_parser(
         'bash', help='Start bash shell in workspace'
     )
@@ -787,7 +952,9 @@ def main():
     )
     bash_parser.set_defaults(func=bash_command)
 
-    # Template command (original functionality)
+
+def _add_template_parser(subparsers):
+    """Add the template rendering command."""
     template_parser = subparsers.add_parser(
         'template', help='Render a Jinja2 template'
     )
@@ -807,23 +974,110 @@ def main():
     )
     template_parser.add_argument(
         "--config",
-        default="config.yaml",
-        help="Path to YAML config file for template variables (default: config.yaml)"
+        help="Path to YAML config file for template variables (default: config.yaml in current directory)"
     )
     template_parser.set_defaults(func=template_command)
 
-    args = parser.parse_args()
 
-    # Handle case where no command is specified (backwards compatibility)
-    if not hasattr(args, 'func'):
-        if hasattr(args, 'template'):
-            # Old-style direct template call
-            template_command(args)
-        else:
+# Subcommand parser builders, keyed by command name in help order
+_PARSER_BUILDERS = {
+    'workspace': _add_workspace_parser,
+    'project': _add_project_parser,
+    'story': _add_story_parser,
+    'claude': _add_claude_parser,
+    'bash': _add_bash_parser,
+    'template': _add_template_parser,
+}
+
+
+def build_parser(argv=None):
+    """Build the CLI argument parser.
+    
+    Only the subcommand named first on the command line gets its parser
+    built, since argparse never looks at the others. Without a known
+    subcommand (top-level help, typos) every subcommand is built so help
+    and "invalid choice" messages list them all.
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+        
+    Returns:
+        Configured ArgumentParser
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    parser = argparse.ArgumentParser(
+        description="Filter - LLM-Powered Kanban board CLI"
+    )
+    parser.add_argument(
+        '--version', '-V', action='version', version=f"filter {__version__}"
+    )
+    parser.set_defaults(func=None)
+    subparsers = parser.add_subparsers(dest='command', help='Commands')
+    
+    command = argv[0] if argv else None
+    if command in _PARSER_BUILDERS:
+        _PARSER_BUILDERS[command](subparsers)
+    else:
+        for add_parser in _PARSER_BUILDERS.values():
+            add_parser(subparsers)
+    
+    return parser
+
+
+def _parse_fast_path(argv):
+    """Parse the common ``bash``/``claude`` invocations without argparse.
+    
+    Both take a workspace name plus arguments that argparse would pass
+    through untouched, so they can skip building a parser. Anything else
+    (options before the workspace, ``--``, unknown flags) returns None and
+    goes through argparse, which handles help and error reporting.
+    
+    Args:
+        argv: Command line arguments without the program name
+        
+    Returns:
+        Parsed arguments, or None if argparse should parse them
+    """
+    if len(argv) < 2 or argv[1].startswith('-'):
+        return None
+    
+    command, workspace, rest = argv[0], argv[1], argv[2:]
+    if command == 'bash' and '--' not in rest:
+        return argparse.Namespace(
+            command=command, workspace=workspace, command_args=rest,
+            func=bash_command
+        )
+    if command == 'claude' and set(rest) <= {'-r', '--resume'}:
+        return argparse.Namespace(
+            command=command, workspace=workspace, resume=bool(rest),
+            func=claude_command
+        )
+    return None
+
+
+def main():
+    """Main CLI entry point."""
+    # Answer a bare version query without building the parser
+    if sys.argv[1:] in (['--version'], ['-V']):
+        print(f"filter {__version__}")
+        return
+
+    args = _parse_fast_path(sys.argv[1:])
+    if args is None:
+        parser = build_parser()
+        args = parser.parse_args()
+
+        # Handle case where no command is specified
+        if args.func is None:
             parser.print_help()
             sys.exit(1)
-    else:
-        args.func(args)
+
+    # Listing workspace templates only prints, so it skips logging setup
+    if not getattr(args, 'list_templates', False):
+        logging.basicConfig(level=logging.INFO)
+    args.func(args)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,7 @@
 """Configuration management for Filter."""
 
+import functools
 import os
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -18,8 +18,16 @@ def find_config_file(start_dir: Optional[Path] = None) -> Optional[Path]:
     if start_dir is None:
         start_dir = Path.cwd()
     
-    current = Path(start_dir).resolve()
+    return _search_config_file(Path(start_dir).resolve())
+
+
+@functools.lru_cache(maxsize=None)
+def _search_config_file(current: Path) -> Optional[Path]:
+    """Walk up from an absolute directory looking for config.yaml.
     
+    Cached per process since every directory helper below repeats the
+    same search for a single CLI invocation.
+    """
     # Search up the directory tree
     while current != current.parent:
         config_path = current / "config.yaml"
@@ -52,9 +60,39 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
             "a Filter project directory or specify the config path."
         )
     
+    return dict(_read_config(Path(config_path)))
+
+
+def load_yaml(stream: Any) -> Any:
+    """Parse YAML using the libyaml loader when PyYAML was built with it.
+    
+    PyYAML is imported on first use so commands that never read YAML do
+    not pay for it at startup.
+    
+    Args:
+        stream: YAML text, bytes or an open file
+        
+    Returns:
+        Parsed data
+        
+    Raises:
+        yaml.YAMLError: If the YAML is invalid
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return yaml.load(stream, Loader=loader)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_config(config_path: Path) -> Dict[str, Any]:
+    """Parse a config file once per process; callers receive copies."""
+    import yaml
+    
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f) or {}
+        config = load_yaml(config_path.read_bytes()) or {}
     except yaml.YAMLError as e:
         raise yaml.YAMLError(f"Invalid YAML in {config_path}: {e}")
     
@@ -136,4 +174,15 @@ def get_kanban_directory(config: Optional[Dict[str, Any]] = None) -> Path:
     project_root = config_path.parent
     kanban_dir = config.get('kanban_directory', './kanban')
     
-    return (project_root / kanban_dir).resolve()
\ No newline at end of file
+    return (project_root / kanban_dir).resolve()
+
+
+def get_cache_directory() -> Path:
+    """Get the directory for Filter's on-disk caches.
+    
+    Returns:
+        Path to the cache directory ($XDG_CACHE_HOME/filter, defaulting to
+        ~/.cache/filter); it may not exist yet
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or '~/.cache'
+    return Path(cache_home).expanduser() / 'filter'
@@ -1,17 +1,21 @@
 """Project management for Filter."""
 
+import functools
 import logging
 import re
 import shutil
-import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
-from .config import get_projects_directory, get_kanban_directory
+from .config import get_projects_directory, get_kanban_directory, load_yaml
 
 logger = logging.getLogger(__name__)
 
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+_WORD_RE = re.compile(r'[a-z]+|[A-Z][a-z]*')
 
+
+@functools.lru_cache(maxsize=256)
 def generate_project_prefix(project_name: str, target_length: int = 5) -> str:
     """Generate a short prefix from project name for story naming.
     
@@ -31,13 +35,13 @@ def generate_project_prefix(project_name: str, target_length: int = 5) -> str:
         'simpl'
     """
     # Remove special characters and convert to lowercase
-    clean_name = re.sub(r'[^a-zA-Z0-9]', '', project_name.lower())
+    clean_name = _NON_ALNUM_RE.sub('', project_name.lower())
     
     if len(clean_name) <= target_length:
         return clean_name
     
     # Try to use first letters of "words" (separated by hyphens, underscores, camelCase)
-    words = re.findall(r'[a-z]+|[A-Z][a-z]*', project_name.lower())
+    words = _WORD_RE.findall(project_name.lower())
     
     if len(words) > 1:
         # Use first 1-2 letters from each word
@@ -86,6 +90,8 @@ def create_project_config(
     Returns:
         Dictionary containing the project configuration
     """
+    import yaml
+
     if maintainers is None:
         maintainers = []
     
@@ -101,8 +107,9 @@ def create_project_config(
     
     # Write config file
     config_file = project_dir / 'project.yaml'
-    with open(config_file, 'w') as f:
-        yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+    config_file.write_text(
+        yaml.safe_dump(config, default_flow_style=False, sort_keys=False)
+    )
     
     logger.info(f"Created project config at {config_file}")
     return config
@@ -117,15 +124,15 @@ def load_project_config(project_dir: Path) -> Optional[Dict[str, Any]]:
     Returns:
         Project configuration dictionary or None if not found
     """
+    import yaml
+
     config_file = project_dir / 'project.yaml'
     
     if not config_file.exists():
         return None
     
     try:
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
-        return config
+        return load_yaml(config_file.read_bytes())
     except yaml.YAMLError as e:
         logger.error(f"Error loading project config from {config_file}: {e}")
         return None
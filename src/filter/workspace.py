@@ -1,18 +1,31 @@
 """Workspace generation utilities for Docker compose environments."""
 
+import functools
 import logging
+import os
 import shutil
 import socket
 import subprocess
-import yaml
+import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from .config import get_workspaces_directory, get_templates_directory, get_kanban_directory
+if TYPE_CHECKING:
+    from jinja2 import Environment, FileSystemBytecodeCache, Template
+
+from .config import (
+    get_cache_directory,
+    get_workspaces_directory,
+    get_templates_directory,
+    get_kanban_directory,
+    load_yaml,
+)
 
 logger = logging.getLogger(__name__)
 
+# Helper scripts copied into every workspace's Docker build context
+_SCRIPTS_DIR = Path(__file__).parent.parent.parent / "scripts"
+
 
 def render_template(template_path: str, context: dict = None) -> str:
     """Render a Jinja2 template with the given context.
@@ -27,20 +40,68 @@ def render_template(template_path: str, context: dict = None) -> str:
     Raises:
         FileNotFoundError: If template file doesn't exist
     """
+    return _get_template(template_path).render(context or {})
+
+
+def _get_template(template_path: str) -> "Template":
+    """Load a template file through its directory's cached environment."""
     template_file = Path(template_path)
 
     if not template_file.exists():
         raise FileNotFoundError(f"Template file not found: {template_path}")
 
-    # Set up Jinja2 environment
-    env = Environment(
-        loader=FileSystemLoader(template_file.parent),
-        autoescape=select_autoescape(['html', 'xml'])
-    )
+    return _template_env(str(template_file.parent)).get_template(template_file.name)
+
+
+@functools.lru_cache(maxsize=1)
+def _bytecode_cache() -> Optional["FileSystemBytecodeCache"]:
+    """Get the on-disk cache of compiled templates shared between runs.
+
+    The cache is best-effort: it is skipped when its directory is not
+    writable, and failing to store a compiled template never fails a render.
+    """
+    from jinja2 import FileSystemBytecodeCache
+
+    class BestEffortBytecodeCache(FileSystemBytecodeCache):
+        def load_bytecode(self, bucket):
+            try:
+                super().load_bytecode(bucket)
+            except OSError as e:
+                logger.debug(f"Could not read cached template bytecode: {e}")
+
+        def dump_bytecode(self, bucket):
+            try:
+                super().dump_bytecode(bucket)
+            except OSError as e:
+                logger.debug(f"Could not cache template bytecode: {e}")
+
+    cache_dir = get_cache_directory() / "jinja"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.debug(f"Template bytecode cache disabled: {e}")
+        return None
+    if not os.access(cache_dir, os.W_OK):
+        logger.debug(f"Template bytecode cache disabled: {cache_dir} is not writable")
+        return None
+    return BestEffortBytecodeCache(str(cache_dir))
+
+
+@functools.lru_cache(maxsize=32)
+def _template_env(template_dir: str) -> "Environment":
+    """Get the Jinja2 environment for a template directory.
+
+    Environments are cached per directory so each template is compiled at
+    most once per process, and compiled bytecode is reused across runs.
+    """
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-    # Load and render template
-    template = env.get_template(template_file.name)
-    return template.render(context or {})
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(['html', 'xml']),
+        auto_reload=False,
+        bytecode_cache=_bytecode_cache()
+    )
 
 
 def find_available_port(start_port: int, max_attempts: int = 100) -> int:
@@ -92,10 +153,9 @@ def list_templates(template_dir: Optional[Path] = None) -> List[Dict]:
             metadata_file = template_path / "template.yaml"
             if metadata_file.exists():
                 try:
-                    with open(metadata_file) as f:
-                        metadata = yaml.safe_load(f)
-                        metadata["path"] = template_path
-                        templates.append(metadata)
+                    metadata = load_yaml(metadata_file.read_bytes())
+                    metadata["path"] = template_path
+                    templates.append(metadata)
                 except Exception as e:
                     logger.warning(f"Error reading template {template_path}: {e}")
             else:
@@ -151,8 +211,7 @@ def create_workspace(
     template_metadata = {}
     metadata_file = template_dir / "template.yaml"
     if metadata_file.exists():
-        with open(metadata_file) as f:
-            template_metadata = yaml.safe_load(f)
+        template_metadata = load_yaml(metadata_file.read_bytes())
 
     # Find available ports based on template requirements
     context = {"workspace_name": workspace_name}
@@ -193,6 +252,7 @@ def create_workspace(
     
     # Render template files
     template_files = ["Dockerfile.j2", "docker-compose.yml.j2", ".env.j2"]
+    cwd = Path.cwd()
     
     for template_file in template_files:
         template_path = template_dir / template_file
@@ -209,7 +269,7 @@ def create_workspace(
                 
                 output_path.write_text(rendered_content)
                 try:
-                    relative_path = output_path.relative_to(Path.cwd())
+                    relative_path = output_path.relative_to(cwd)
                     logger.info(f"Created {relative_path}")
                 except ValueError:
                     logger.info(f"Created {output_path}")
@@ -230,7 +290,7 @@ def create_workspace(
         logger.warning(f"kanban directory not found at {kanban_src}, skipping copy")
     
     # Copy scripts directory and entrypoint script for Docker build context
-    scripts_src = Path(__file__).parent.parent.parent / "scripts"
+    scripts_src = _SCRIPTS_DIR
     entrypoint_src = template_dir / "entrypoint.sh"
     
     if scripts_src.exists():
@@ -298,13 +358,50 @@ def exec_workspace_command(workspace_name: str, command: List[str], interactive:
     Raises:
         RuntimeError: If workspace/container not found
     """
+    docker_cmd = _docker_exec_command(workspace_name, command, interactive)
+
+    try:
+        return subprocess.run(docker_cmd).returncode
+    except KeyboardInterrupt:
+        return 130  # Standard exit code for Ctrl+C
+    except Exception as e:
+        raise RuntimeError(f"Failed to execute command: {e}") from e
+
+
+def exec_workspace_command_replace(workspace_name: str, command: List[str], interactive: bool = None) -> None:
+    """Replace the current process with a command in the workspace claude container.
+    
+    Unlike exec_workspace_command, this never returns on success: docker
+    takes over the process, so its exit code becomes ours and Python skips
+    interpreter teardown.
+    
+    Args:
+        workspace_name: Name of the workspace
+        command: Command to execute as list of strings
+        interactive: Whether to run in interactive mode (auto-detected if None)
+        
+    Raises:
+        RuntimeError: If workspace/container not found or docker can't be run
+    """
+    docker_cmd = _docker_exec_command(workspace_name, command, interactive)
+
+    # exec discards anything still sitting in Python's buffers
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        os.execvp(docker_cmd[0], docker_cmd)
+    except OSError as e:
+        raise RuntimeError(f"Failed to execute command: {e}") from e
+
+
+def _docker_exec_command(workspace_name: str, command: List[str], interactive: Optional[bool]) -> List[str]:
+    """Build the docker exec command line for a workspace claude container."""
     container_name = find_workspace_container(workspace_name, "claude")
 
     docker_cmd = ["docker", "exec"]
 
     # Auto-detect interactive mode if not specified
     if interactive is None:
-        import sys
         interactive = sys.stdin.isatty() and sys.stdout.isatty()
 
     if interactive:
@@ -314,14 +411,7 @@ def exec_workspace_command(workspace_name: str, command: List[str], interactive:
     docker_cmd.extend(["--workdir", "/workspace"])
 
     docker_cmd.extend([container_name] + command)
-
-    try:
-        # Replace current process with docker exec
-        return subprocess.run(docker_cmd).returncode
-    except KeyboardInterrupt:
-        return 130  # Standard exit code for Ctrl+C
-    except Exception as e:
-        raise RuntimeError(f"Failed to execute command: {e}") from e
+    return docker_cmd
 
 
 def stop_workspace(workspace_name: str, base_dir: Optional[Path] = None) -> None:
@@ -430,12 +520,13 @@ def clone_git_repository(workspace_dir: Path, git_url: str, branch_name: str) ->
         RuntimeError: If git operations fail
     """
     repo_dir = workspace_dir / "workspace" / "repo"
+    repo_path = os.fspath(repo_dir)
     
     try:
         # Clone the repository
         logger.info(f"Cloning repository {git_url} to {repo_dir}")
         subprocess.run(
-            ["git", "clone", git_url, str(repo_dir)],
+            ["git", "clone", git_url, repo_path],
             check=True,
             capture_output=True,
             text=True
@@ -445,7 +536,7 @@ def clone_git_repository(workspace_dir: Path, git_url: str, branch_name: str) ->
         logger.info(f"Creating and checking out branch {branch_name}")
         subprocess.run(
             ["git", "checkout", "-b", branch_name],
-            cwd=repo_dir,
+            cwd=repo_path,
             check=True,
             capture_output=True,
             text=True
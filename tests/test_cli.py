@@ -0,0 +1,59 @@
+"""Tests for the Filter command line interface."""
+
+import pytest
+
+from filter.cli import (
+    _parse_fast_path,
+    _plain_story_template,
+    _story_env,
+    build_parser,
+    render_story_template,
+)
+
+
+@pytest.mark.parametrize("argv", [
+    ["bash", "ws"],
+    ["bash", "ws", "-h"],
+    ["bash", "ws", "--help"],
+    ["bash", "ws", "-V"],
+    ["bash", "ws", "--foo=1"],
+    ["bash", "ws", "-c", "ls -l"],
+    ["claude", "ws"],
+    ["claude", "ws", "-r"],
+    ["claude", "ws", "-r", "--resume"],
+])
+def test_fast_path_matches_argparse(argv):
+    """The argparse-free fast path must produce argparse's exact Namespace."""
+    fast = _parse_fast_path(argv)
+    assert fast is not None
+    assert vars(fast) == vars(build_parser(argv).parse_args(argv))
+
+
+@pytest.mark.parametrize("argv", [
+    [],
+    ["bash"],
+    ["bash", "-h"],
+    ["bash", "ws", "--", "x"],
+    ["bash", "ws", "x", "--", "y"],
+    ["claude", "ws", "-h"],
+    ["claude", "ws", "--res"],
+    ["template", "t.j2"],
+])
+def test_fast_path_defers_to_argparse(argv):
+    """Anything the fast path can't reproduce exactly is left to argparse."""
+    assert _parse_fast_path(argv) is None
+
+
+def test_plain_story_render_matches_jinja():
+    """Plain substitution must render default.md.j2 exactly as Jinja2 does."""
+    context = {
+        "story_id": "ST-42",
+        "story_description": "Café menu <b>&</b> {{ not a tag }}",
+        "repository": "marketbridge",
+        "branch_from": "main",
+        "merge_to": "release",
+        "feature_branch": "feature/ST-42",
+    }
+    assert _plain_story_template("default.md.j2") is not None
+    expected = _story_env().get_template("default.md.j2").render(**context)
+    assert render_story_template("default.md.j2", **context) == expected